@@ -1,15 +1,373 @@
-import networkx as nx
+import functools
+import operator
+import numpy as np
 from datetime import datetime
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Pure-Python fallback: the kernels below run unchanged, just interpreted
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# Per-edge governance status codes; the trace text is only formatted for printed segments
+STATUS_CLEAR = 0
+STATUS_IRI = 1
+STATUS_FLOOD = 2
+STATUS_SURGE = 3
+STATUS_AQI = 4
+
+
+def _format_status(code, density):
+    """Renders a status code as the governance trace label shown to administrators."""
+    if code == STATUS_IRI:
+        return "CAUTION_ROUGH_ROAD"
+    if code == STATUS_FLOOD:
+        return "BLOCKADE_FLOOD_ALERT"
+    if code == STATUS_SURGE:
+        return f"SURGE_ALERT_{density}P/m2"
+    if code == STATUS_AQI:
+        return "HEALTH_NUDGE_ACTIVE"
+    return "Clear"
+
+
+# --- GOVERNANCE & SEARCH KERNELS (plain arrays only, so Numba can compile them) ---
+
+@njit(cache=True)
+def _reverse_csr_nb(indices, rev_indptr, rev_edge_id):
+    """Counting-sorts the forward edges by destination hub into a reverse CSR.
+
+    Fills rev_indptr (in-degree prefix sums) and rev_edge_id (forward edge
+    index for each reverse slot); edges keep their forward order per hub.
+    """
+    rev_indptr[:] = 0
+    for e in range(indices.shape[0]):
+        rev_indptr[indices[e] + 1] += 1
+    for v in range(rev_indptr.shape[0] - 1):
+        rev_indptr[v + 1] += rev_indptr[v]
+    fill = rev_indptr[:-1].copy()
+    for e in range(indices.shape[0]):
+        v = indices[e]
+        rev_edge_id[fill[v]] = e
+        fill[v] += 1
+
+
+@njit(parallel=True, cache=True)
+def _apply_penalties(base_times, iri, density, aqi_factor, touches_ghat, iri_threshold, crowd_limit,
+                     aqi_alert, flooded, blockade_cost, out_weight, out_status):
+    """Applies the governance gates to every edge independently, in parallel across cores.
+
+    Returns how many edges ended up cheaper than their base time, which voids
+    the base-time landmark bounds for this tick.
+    """
+    n_undercut = 0
+    for e in prange(base_times.shape[0]):
+        cost = float(base_times[e])
+        status = STATUS_CLEAR
+
+        # 1. INFRASTRUCTURE: Road Quality (IRI)
+        if iri[e] > iri_threshold:
+            cost *= 1.4  # 40% maintenance penalty for E-Bus protection
+            status = STATUS_IRI
+
+        # 2. PREDICTIVE: KICCC Crowd Analytics
+        if density[e] > crowd_limit:
+            cost *= density[e] / 2.0  # Exponential congestion penalty
+            status = STATUS_SURGE
+
+        # 3. HEALTH: Environmental AQI Nudge
+        if aqi_alert:
+            cost *= aqi_factor[e]
+            if status == STATUS_CLEAR:
+                status = STATUS_AQI
+
+        # 4. SAFETY: CWC Flood Danger Gate
+        if flooded and touches_ghat[e]:
+            cost = blockade_cost  # Infinite cost to simulate a blockade
+            status = STATUS_FLOOD
+
+        out_weight[e] = cost
+        out_status[e] = status
+        if cost < base_times[e]:
+            n_undercut += 1
+    return n_undercut
+
+
+@njit(cache=True)
+def _dheap_sift_up(keys, node_at, pos_of, i):
+    """Moves the entry at position i of the 4-ary heap up until its parent is no larger."""
+    key, node = keys[i], node_at[i]
+    while i > 0:
+        parent = (i - 1) >> 2
+        if keys[parent] <= key:
+            break
+        keys[i] = keys[parent]
+        node_at[i] = node_at[parent]
+        pos_of[node_at[i]] = i
+        i = parent
+    keys[i] = key
+    node_at[i] = node
+    pos_of[node] = i
+
+
+@njit(cache=True)
+def _dheap_push(keys, node_at, pos_of, size, node, key):
+    """Queues `node` with `key`, or decreases its key if already queued; returns the new size."""
+    i = pos_of[node]
+    if i < 0:
+        i = size
+        size += 1
+        node_at[i] = node
+    keys[i] = key
+    _dheap_sift_up(keys, node_at, pos_of, i)
+    return size
+
+
+@njit(cache=True)
+def _dheap_pop(keys, node_at, pos_of, size):
+    """Removes the minimum entry of the 4-ary heap; returns (key, node, new_size)."""
+    top_key, top_node = keys[0], node_at[0]
+    pos_of[top_node] = -1
+    size -= 1
+    if size > 0:
+        key, node = keys[size], node_at[size]
+        i = 0
+        while True:
+            first = 4 * i + 1
+            if first >= size:
+                break
+            child = first
+            for c in range(first + 1, min(first + 4, size)):
+                if keys[c] < keys[child]:
+                    child = c
+            if keys[child] >= key:
+                break
+            keys[i] = keys[child]
+            node_at[i] = node_at[child]
+            pos_of[node_at[i]] = i
+            i = child
+        keys[i] = key
+        node_at[i] = node
+        pos_of[node] = i
+    return top_key, top_node, size
+
+
+@njit(cache=True)
+def _dijkstra_sssp_nb(indptr, heads, weights, src, dist, prev):
+    """One-to-all Dijkstra over CSR arrays.
+
+    Fills `dist` (inf where unreachable) and `prev`, the CSR position of the
+    edge used to reach each hub (-1 for the source and unreached hubs).
+    """
+    n_nodes = indptr.shape[0] - 1
+    keys = np.empty(n_nodes)
+    node_at = np.empty(n_nodes, dtype=np.int32)
+    pos_of = np.full(n_nodes, -1, dtype=np.int32)
+    dist[:] = np.inf
+    prev[:] = -1
+    dist[src] = 0.0
+    size = _dheap_push(keys, node_at, pos_of, 0, src, 0.0)
+    while size > 0:
+        d, u, size = _dheap_pop(keys, node_at, pos_of, size)
+        for e in range(indptr[u], indptr[u + 1]):
+            v = heads[e]
+            nd = d + weights[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = e
+                size = _dheap_push(keys, node_at, pos_of, size, v, nd)
+
+
+@njit(cache=True)
+def _dijkstra_targets_nb(indptr, heads, weights, src, is_target, n_targets, dist, prev):
+    """One-to-many Dijkstra that stops as soon as every hub flagged in `is_target` is settled.
+
+    Fills `dist` and `prev` like _dijkstra_sssp_nb; hubs left unsettled when
+    the search stops may hold tentative values, but every target is exact.
+    """
+    n_nodes = indptr.shape[0] - 1
+    keys = np.empty(n_nodes)
+    node_at = np.empty(n_nodes, dtype=np.int32)
+    pos_of = np.full(n_nodes, -1, dtype=np.int32)
+    dist[:] = np.inf
+    prev[:] = -1
+    dist[src] = 0.0
+    size = _dheap_push(keys, node_at, pos_of, 0, src, 0.0)
+    while size > 0:
+        d, u, size = _dheap_pop(keys, node_at, pos_of, size)
+        if is_target[u]:
+            n_targets -= 1
+            if n_targets == 0:
+                break
+        for e in range(indptr[u], indptr[u + 1]):
+            v = heads[e]
+            nd = d + weights[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = e
+                size = _dheap_push(keys, node_at, pos_of, size, v, nd)
+
+
+@njit(cache=True)
+def _alt_potential(lm_from, lm_to, src, dst, v):
+    """Average ALT potential of hub v: half of (bound on d(v, dst) - bound on d(src, v)).
+
+    Both lower bounds come from the triangle inequality against each landmark.
+    An infinite bound proves v cannot lie on any src-dst route, which makes
+    every reduced cost into or out of it infinite and prunes it from the search.
+    """
+    to_dst = 0.0
+    from_src = 0.0
+    for l in range(lm_from.shape[0]):
+        # A landmark that cannot reach (or be reached from) the subtracted hub says nothing
+        if lm_from[l, v] < np.inf:
+            to_dst = max(to_dst, lm_from[l, dst] - lm_from[l, v])
+        if lm_to[l, dst] < np.inf:
+            to_dst = max(to_dst, lm_to[l, v] - lm_to[l, dst])
+        if lm_from[l, src] < np.inf:
+            from_src = max(from_src, lm_from[l, v] - lm_from[l, src])
+        if lm_to[l, v] < np.inf:
+            from_src = max(from_src, lm_to[l, src] - lm_to[l, v])
+    if to_dst == np.inf:
+        return np.inf
+    return 0.5 * (to_dst - from_src)
+
+
+@njit(cache=True)
+def _bidirectional_dijkstra_nb(indptr, indices, edge_src, rev_indptr, rev_edge_id, weights,
+                               lm_from, lm_to, src, dst, prev_f, next_b):
+    """Bidirectional A* over CSR arrays with ALT landmark potentials.
+
+    Both searches run Dijkstra on the reduced costs w(u, v) - p(u) + p(v) of the
+    average potential p, which are non-negative and shift every src-dst route by
+    the same constant, so the bidirectional stopping rule still holds. Fills
+    prev_f (edge into each hub on the forward tree) and next_b (edge out of each
+    hub on the backward tree) and returns the meeting hub, or -1 when dst is
+    unreachable.
+    """
+    n_nodes = indptr.shape[0] - 1
+    prev_f[:] = -1
+    next_b[:] = -1
+    pot = np.empty(n_nodes)
+    pot_known = np.zeros(n_nodes, dtype=np.bool_)
+    for root in (src, dst):
+        pot[root] = _alt_potential(lm_from, lm_to, src, dst, root)
+        pot_known[root] = True
+        if not np.isfinite(pot[root]):
+            return -1
+    if src == dst:
+        return src
+
+    dist_f = np.full(n_nodes, np.inf)
+    dist_b = np.full(n_nodes, np.inf)
+    # Indexed 4-ary heaps: each hub is queued at most once and improved via decrease-key
+    keys_f = np.empty(n_nodes)
+    nodes_f = np.empty(n_nodes, dtype=np.int32)
+    pos_f = np.full(n_nodes, -1, dtype=np.int32)
+    keys_b = np.empty(n_nodes)
+    nodes_b = np.empty(n_nodes, dtype=np.int32)
+    pos_b = np.full(n_nodes, -1, dtype=np.int32)
+
+    dist_f[src] = 0.0
+    dist_b[dst] = 0.0
+    size_f = _dheap_push(keys_f, nodes_f, pos_f, 0, src, 0.0)
+    size_b = _dheap_push(keys_b, nodes_b, pos_b, 0, dst, 0.0)
+    best = np.inf
+    meet = -1
+
+    while size_f > 0 and size_b > 0:
+        if keys_f[0] + keys_b[0] >= best:
+            break
+        # Expand whichever frontier is currently closer to its root
+        if keys_f[0] <= keys_b[0]:
+            d, u, size_f = _dheap_pop(keys_f, nodes_f, pos_f, size_f)
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                if not pot_known[v]:
+                    pot[v] = _alt_potential(lm_from, lm_to, src, dst, v)
+                    pot_known[v] = True
+                nd = d + weights[e] - pot[u] + pot[v]
+                # Only improvements touch the heap
+                if nd < dist_f[v]:
+                    dist_f[v] = nd
+                    prev_f[v] = e
+                    size_f = _dheap_push(keys_f, nodes_f, pos_f, size_f, v, nd)
+                    if nd + dist_b[v] < best:
+                        best = nd + dist_b[v]
+                        meet = v
+        else:
+            d, u, size_b = _dheap_pop(keys_b, nodes_b, pos_b, size_b)
+            for p in range(rev_indptr[u], rev_indptr[u + 1]):
+                e = rev_edge_id[p]
+                v = edge_src[e]
+                if not pot_known[v]:
+                    pot[v] = _alt_potential(lm_from, lm_to, src, dst, v)
+                    pot_known[v] = True
+                nd = d + weights[e] - pot[v] + pot[u]
+                if nd < dist_b[v]:
+                    dist_b[v] = nd
+                    next_b[v] = e
+                    size_b = _dheap_push(keys_b, nodes_b, pos_b, size_b, v, nd)
+                    if nd + dist_f[v] < best:
+                        best = nd + dist_f[v]
+                        meet = v
+
+    return meet
+
+
+def _warmup_kernels():
+    """Compiles the JIT kernels on a 2-hub dummy graph so the first real query doesn't pay for it."""
+    times = np.ones(1, dtype=np.float32)
+    _apply_penalties(times, np.zeros(1), np.zeros(1), np.ones(1), np.zeros(1, dtype=np.bool_), 170, 4.0,
+                     True, True, 1e9, np.empty(1, dtype=np.float32), np.empty(1, dtype=np.uint8))
+    indptr = np.array([0, 1, 1], dtype=np.int32)
+    indices = np.array([1], dtype=np.int32)
+    edge_src = np.array([0], dtype=np.int32)
+    rev_indptr = np.array([0, 0, 1], dtype=np.int32)
+    rev_edge_id = np.array([0], dtype=np.int32)
+    _reverse_csr_nb(indices, np.empty(3, dtype=np.int32), np.empty(1, dtype=np.int32))
+    dist = np.empty(2)
+    prev_f = np.empty(2, dtype=np.int32)
+    next_b = np.empty(2, dtype=np.int32)
+    _dijkstra_sssp_nb(indptr, indices, times, 0, dist, prev_f)
+    _dijkstra_sssp_nb(indptr, indices, np.ones(1), 0, dist, prev_f)
+    _dijkstra_targets_nb(indptr, indices, times, 0, np.ones(2, dtype=np.bool_), 2, dist, prev_f)
+    _bidirectional_dijkstra_nb(indptr, indices, edge_src, rev_indptr, rev_edge_id, times,
+                               np.zeros((1, 2)), np.zeros((1, 2)), 0, 1, prev_f, next_b)
+
+
+if NUMBA_AVAILABLE:
+    _warmup_kernels()
+
+
 class KashiPathEngine:
+    # Integer ids for each transit mode, stored per edge in the CSR `modes` array;
+    # a set of modes is the bitmask OR of (1 << id)
+    MODE_IDS = {"E-Bus": 0, "E-Rickshaw": 1, "Ambulance": 2}
+    # AQI nudge per mode id: open E-Rickshaws expose riders more than closed vehicles
+    AQI_MODE_FACTOR = np.array([1.05, 1.1, 1.05])
+    # Below this many destinations, separate point-to-point ALT searches beat one
+    # one-to-many search that has to grow until it settles the farthest target
+    ONE_TO_MANY_MIN_TARGETS = 12
+
     def __init__(self):
-        # Using MultiDiGraph to support different transit modes on the same route
-        self.G = nx.MultiDiGraph()
-        
         # Governance Constants & Thresholds
         self.FLOOD_DANGER_MARK = 71.26
         self.IRI_BAD_THRESHOLD = 170
         self.CROWD_SAFETY_LIMIT = 4.0
+        self.BLOCKADE_COST = 1e9
+
+        # Routing results are memoized per weight epoch; every pulse tick bumps the
+        # epoch, so answers from older weights simply stop being looked up
+        self._weight_epoch = 0
+        self._solve_cached = functools.lru_cache(maxsize=4096)(self._solve_uncached)
         
         self.initialize_city_network()
 
@@ -22,8 +380,6 @@ class KashiPathEngine:
             ("BHU_Trauma_Centre", "Hospital"), ("SSPG_Kabir_Chaura", "Hospital"),
             ("Maidagin_Chowk", "Junction"), ("Dashashwamedh_Ghat", "Riverfront")
         ]
-        for name, n_type in hubs:
-            self.G.add_node(name, type=n_type)
 
         # 2. EDGES: Multi-modal connections with explicit mode tagging
         # Format: (Source, Target, BaseTime, Mode)
@@ -43,74 +399,271 @@ class KashiPathEngine:
             ("Cantt_Station", "BHU_Trauma_Centre", 22, "Ambulance")
         ]
         
-        for u, v, t, m in routes:
-            # Ensure every edge is initialized with all required keys to prevent KeyErrors
-            self.G.add_edge(u, v, weight=float(t), base_time=float(t), mode=m, status="Clear")
+        self._build_csr(hubs, routes)
+
+    def _build_csr(self, hubs, routes):
+        """Flattens hubs and routes into Compressed Sparse Row arrays.
+
+        The out-edges of hub u live at positions indptr[u]:indptr[u+1] of the
+        parallel `indices`, `base_times`, `weights` and `modes` arrays.
+        """
+        # Every hub gets a small integer id used to index the CSR arrays
+        self.node_names = [name for name, _ in hubs]
+        self.node_types = [n_type for _, n_type in hubs]
+        self.node_index = {name: idx for idx, name in enumerate(self.node_names)}
+
+        routes = sorted(routes, key=lambda r: self.node_index[r[0]])
+        n_nodes = len(self.node_names)
+
+        self.edge_src = np.array([self.node_index[u] for u, _, _, _ in routes], dtype=np.int32)
+        self.indptr = np.zeros(n_nodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(self.edge_src, minlength=n_nodes), out=self.indptr[1:])
+        self.indices = np.array([self.node_index[v] for _, v, _, _ in routes], dtype=np.int32)
+        # Edge weights are stored as float32 to halve the bytes each relaxation reads;
+        # searches still accumulate distances in float64
+        self.base_times = np.array([t for _, _, t, _ in routes], dtype=np.float32)
+        self.weights = self.base_times.copy()
+        self.modes = np.array([self.MODE_IDS[m] for _, _, _, m in routes], dtype=np.uint8)
+
+        # Reverse adjacency for backward searches: the in-edges of hub v are the forward
+        # edges rev_edge_id[rev_indptr[v]:rev_indptr[v+1]], so they read `weights` in place
+        self.rev_indptr = np.empty(n_nodes + 1, dtype=np.int32)
+        self.rev_edge_id = np.empty(len(routes), dtype=np.int32)
+        _reverse_csr_nb(self.indices, self.rev_indptr, self.rev_edge_id)
+
+        # One weight view per lane combination a vehicle may use, with forbidden
+        # lanes pre-priced at BLOCKADE_COST so the search never checks modes
+        self._csr_by_mode = {}
+        self._lanes_by_mode = {}
+        for allowed in (("E-Rickshaw",), ("E-Bus",), ("Ambulance", "E-Bus")):
+            self._mode_csr(self._mode_mask(allowed))
+
+        # Per-edge lookups the governance tick would otherwise rebuild every pulse
+        edge_keys = {}
+        for e, (u, v, _, _) in enumerate(routes):
+            edge_keys.setdefault(f"{u}-{v}", []).append(e)
+        self._edge_key_idx = {k: np.array(ids, dtype=np.int32) for k, ids in edge_keys.items()}
+        hub_is_ghat = np.array(["Ghat" in name for name in self.node_names], dtype=bool)
+        self._touches_ghat = hub_is_ghat[self.edge_src] | hub_is_ghat[self.indices]
+        self._aqi_factor = self.AQI_MODE_FACTOR[self.modes]
+
+        # Status code per edge from the latest tick, plus a snapshot of that tick's raw
+        # crowd feed so SURGE labels print each reading exactly as it arrived
+        self._status_code = np.full(len(routes), STATUS_CLEAR, dtype=np.uint8)
+        self._crowd_readings = {}
+
+        # Scratch buffers refilled in place by every tick, so syncing allocates nothing
+        self._iri_buf = np.empty(len(routes))
+        self._density_buf = np.empty(len(routes))
+        self._node_density_buf = np.empty(n_nodes)
+
+        self._build_landmarks()
+
+    def _build_landmarks(self, n_landmarks=4):
+        """Precomputes ALT landmark distances on the base travel times.
+
+        With the default thresholds every governance gate only scales a base
+        time up or replaces it with BLOCKADE_COST, so base-time distances stay
+        admissible lower bounds for any tick and any lane set. A tick that
+        prices some edge below its base time (e.g. CROWD_SAFETY_LIMIT under 2)
+        is detected on sync and searched without potentials instead.
+        """
+        rev_heads = self.edge_src[self.rev_edge_id]
+        rev_times = self.base_times[self.rev_edge_id]
+        n_nodes = len(self.node_names)
+        n_landmarks = min(n_landmarks, n_nodes)
+        self._lm_from = np.empty((n_landmarks, n_nodes))
+        self._lm_to = np.empty((n_landmarks, n_nodes))
+
+        # Farthest-first selection: each new landmark is the hub worst covered so far
+        prev = np.empty(n_nodes, dtype=np.int32)
+        coverage = np.full(n_nodes, np.inf)
+        landmark = 0
+        for i in range(n_landmarks):
+            _dijkstra_sssp_nb(self.indptr, self.indices, self.base_times, landmark, self._lm_from[i], prev)
+            _dijkstra_sssp_nb(self.rev_indptr, rev_heads, rev_times, landmark, self._lm_to[i], prev)
+            np.minimum(coverage, self._lm_from[i] + self._lm_to[i], out=coverage)
+            landmark = int(np.argmax(coverage))
+
+        # Landmark tables used by the next search; zero landmarks means zero potentials
+        self._no_landmarks = np.empty((0, n_nodes))
+        self._lm_active = (self._lm_from, self._lm_to)
+
+    def _mode_mask(self, allowed):
+        """Encodes the mode names in `allowed` as a bitmask; unknown modes contribute nothing."""
+        return functools.reduce(operator.or_, (1 << self.MODE_IDS[m] for m in allowed if m in self.MODE_IDS), 0)
+
+    def _mode_csr(self, allowed_mask):
+        """Returns (indptr, indices, weights) for the lane bitmask `allowed_mask`, building it on first use."""
+        if allowed_mask not in self._csr_by_mode:
+            lanes = (np.left_shift(1, self.modes, dtype=np.uint32) & allowed_mask) != 0
+            weights = np.full(len(self.indices), self.BLOCKADE_COST, dtype=np.float32)
+            np.copyto(weights, self.weights, where=lanes)
+            self._lanes_by_mode[allowed_mask] = lanes
+            self._csr_by_mode[allowed_mask] = (self.indptr, self.indices, weights)
+        return self._csr_by_mode[allowed_mask]
 
     def sync_governance_data(self, flood_lvl, aqi, road_conditions, crowd_densities, mela_active=False):
         """Updates graph weights based on real-time city pulse."""
+        self._weight_epoch += 1
         print(f"\n--- Unified Kashi-Pulse Update: {datetime.now().strftime('%H:%M:%S')} ---")
         
-        for u, v, key, data in self.G.edges(keys=True, data=True):
-            # Start with the base travel time
-            cost = data.get('base_time', 15.0)
-            status = "Clear"
-            mode = data.get('mode', 'General')
-
-            # 1. INFRASTRUCTURE: Road Quality (IRI)
-            if road_conditions.get(f"{u}-{v}", 80) > self.IRI_BAD_THRESHOLD:
-                cost *= 1.4  # 40% maintenance penalty for E-Bus protection
-                status = "CAUTION_ROUGH_ROAD"
-
-            # 2. PREDICTIVE: KICCC Crowd Analytics
-            density = crowd_densities.get(v, 0.5)
-            if density > self.CROWD_SAFETY_LIMIT:
-                cost *= (density / 2.0)  # Exponential congestion penalty
-                status = f"SURGE_ALERT_{density}P/m2"
-
-            # 3. HEALTH: Environmental AQI Nudge
-            if aqi > 200:
-                cost *= 1.1 if mode == "E-Rickshaw" else 1.05
-                if status == "Clear": status = "HEALTH_NUDGE_ACTIVE"
-
-            # 4. SAFETY: CWC Flood Danger Gate
-            if flood_lvl >= self.FLOOD_DANGER_MARK and ("Ghat" in v or "Ghat" in u):
-                cost = 1e9  # Infinite cost to simulate a blockade
-                status = "BLOCKADE_FLOOD_ALERT"
-
-            # Update the edge with new calculated weight and status trace
-            self.G[u][v][key].update({'weight': cost, 'status': status})
+        # Scatter the raw feeds into the edge buffers: IRI by "u-v" key, crowd density by destination hub
+        self._iri_buf.fill(80.0)
+        for key, iri in road_conditions.items():
+            edge_ids = self._edge_key_idx.get(key)
+            if edge_ids is not None:
+                self._iri_buf[edge_ids] = iri
+        self._node_density_buf.fill(0.5)
+        for hub, density in crowd_densities.items():
+            if hub in self.node_index:
+                self._node_density_buf[self.node_index[hub]] = density
+        np.take(self._node_density_buf, self.indices, out=self._density_buf)
+        self._crowd_readings = dict(crowd_densities)
+
+        n_undercut = _apply_penalties(self.base_times, self._iri_buf, self._density_buf, self._aqi_factor,
+                                      self._touches_ghat, self.IRI_BAD_THRESHOLD, self.CROWD_SAFETY_LIMIT,
+                                      aqi > 200, flood_lvl >= self.FLOOD_DANGER_MARK, self.BLOCKADE_COST,
+                                      self.weights, self._status_code)
+
+        # The landmark bounds only hold while no edge is cheaper than its base time
+        if n_undercut == 0:
+            self._lm_active = (self._lm_from, self._lm_to)
+        else:
+            self._lm_active = (self._no_landmarks, self._no_landmarks)
+
+        for allowed_mask, (_, _, weights) in self._csr_by_mode.items():
+            np.copyto(weights, self.weights, where=self._lanes_by_mode[allowed_mask])
+
+    def _edge_status(self, e):
+        """Formats the governance trace for edge `e` from the latest tick's status code."""
+        hub = self.node_names[self.indices[e]]
+        return _format_status(self._status_code[e], self._crowd_readings.get(hub, 0.5))
+
+    def _bidirectional_dijkstra(self, src, dst, allowed_mask):
+        """Point-to-point Dijkstra grown from both ends over the CSR arrays.
+
+        Lanes outside the `allowed_mask` mode bitmask are priced at BLOCKADE_COST
+        rather than removed. The forward search follows out-edges from `src`,
+        the backward search follows in-edges from `dst`, and both stop once
+        their frontiers can no longer improve the best meeting point. Returns
+        the CSR edge indices along the route with its total cost, or (None, inf).
+        """
+        indptr, indices, weights = self._mode_csr(allowed_mask)
+        lm_from, lm_to = self._lm_active
+        n_nodes = len(self.node_names)
+        prev_f = np.empty(n_nodes, dtype=np.int32)
+        next_b = np.empty(n_nodes, dtype=np.int32)
+        meet = _bidirectional_dijkstra_nb(
+            indptr, indices, self.edge_src, self.rev_indptr, self.rev_edge_id, weights,
+            lm_from, lm_to, src, dst, prev_f, next_b)
+
+        if meet < 0:
+            return None, np.inf
+
+        # Only the meeting hub joins the two trees, so stitch the route from there
+        path_edges = []
+        u = meet
+        while u != src:
+            e = prev_f[u]
+            path_edges.append(e)
+            u = self.edge_src[e]
+        path_edges.reverse()
+        u = meet
+        while u != dst:
+            e = next_b[u]
+            path_edges.append(e)
+            u = self.indices[e]
+        return path_edges, sum((float(weights[e]) for e in path_edges), 0.0)
+
+    def _vehicle_mask(self, vehicle_type):
+        """Lane bitmask a vehicle may use."""
+        # Define allowed modes: Ambulances can use E-Bus lanes
+        return self._mode_mask((vehicle_type, "E-Bus") if vehicle_type == "Ambulance" else (vehicle_type,))
+
+    def _solve_uncached(self, src, dst, vehicle_type, epoch):
+        """Routes hub `src` to hub `dst`; `epoch` only keys the memo cache."""
+        path_edges, total_cost = self._bidirectional_dijkstra(src, dst, self._vehicle_mask(vehicle_type))
+        if path_edges is None:
+            return None, total_cost
+        return tuple(path_edges), total_cost
+
+    def _solve_one_to_many(self, src, dsts, vehicle_type):
+        """Routes hub `src` to every hub in `dsts`; returns {dst: (path_edges, cost)}, (None, inf) if unreachable."""
+        targets = set(dsts)
+        if len(targets) < self.ONE_TO_MANY_MIN_TARGETS:
+            return {dst: self._solve_cached(src, dst, vehicle_type, self._weight_epoch) for dst in targets}
+
+        # One Dijkstra from the source, stopped once the last destination is settled
+        _, indices, weights = self._mode_csr(self._vehicle_mask(vehicle_type))
+        n_nodes = len(self.node_names)
+        is_target = np.zeros(n_nodes, dtype=bool)
+        is_target[list(targets)] = True
+        dist = np.empty(n_nodes)
+        prev = np.empty(n_nodes, dtype=np.int32)
+        _dijkstra_targets_nb(self.indptr, indices, weights, src, is_target, len(targets), dist, prev)
+
+        routes = {}
+        for dst in targets:
+            if np.isinf(dist[dst]):
+                routes[dst] = (None, np.inf)
+                continue
+            path_edges = []
+            u = dst
+            while u != src:
+                e = prev[u]
+                path_edges.append(int(e))
+                u = self.edge_src[e]
+            path_edges.reverse()
+            routes[dst] = (tuple(path_edges), sum((float(weights[e]) for e in path_edges), 0.0))
+        return routes
 
     def solve_path(self, start, end, vehicle_type):
         """Solves for the optimal path while providing interpretability traces."""
-        # Define allowed modes: Ambulances can use E-Bus lanes
-        allowed_modes = [vehicle_type]
-        if vehicle_type == "Ambulance":
-            allowed_modes.append("E-Bus")
-
-        # Robust weight logic to prevent KeyErrors
-        def weight_logic(u, v, d):
-            edge_mode = d.get('mode', 'General')
-            edge_weight = d.get('weight', 1e9)
-            return edge_weight if edge_mode in allowed_modes else 1e9
-
-        try:
-            path = nx.shortest_path(self.G, start, end, weight=weight_logic)
-            total_cost = nx.shortest_path_length(self.G, start, end, weight=weight_logic)
-            
-            print(f"\n[{vehicle_type}] Optimized Route: {' -> '.join(path)}")
-            print(f"Governance Cost Score: {total_cost:.2f}")
-            
-            # Print Logic Trace for transparency
-            for i in range(len(path)-1):
-                # Retrieve edge data safely
-                edge_data = list(self.G.get_edge_data(path[i], path[i+1]).values())[0]
-                if edge_data.get('status') != "Clear":
-                    print(f"  > Segment {path[i]}-{path[i+1]}: {edge_data['status']}")
-            
-            return path
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        if start not in self.node_index or end not in self.node_index:
             print(f"[!] No safe route found for {vehicle_type} from {start} to {end}.")
+            return None
+
+        src, dst = self.node_index[start], self.node_index[end]
+        path_edges, total_cost = self._solve_cached(src, dst, vehicle_type, self._weight_epoch)
+        return self._report_route(start, end, vehicle_type, path_edges, total_cost)
+
+    def solve_paths_one_to_many(self, start, ends, vehicle_type):
+        """Solves routes from one hub to many, sharing one search across them when there are enough.
+
+        Prints each route like solve_path and returns {end: (path, cost)},
+        with (None, inf) for destinations that cannot be reached.
+        """
+        known = [end for end in ends if end in self.node_index]
+        routes = {}
+        if start in self.node_index and known:
+            src = self.node_index[start]
+            solved = self._solve_one_to_many(src, [self.node_index[end] for end in known], vehicle_type)
+            routes = {end: solved[self.node_index[end]] for end in known}
+
+        results = {}
+        for end in ends:
+            path_edges, total_cost = routes.get(end, (None, np.inf))
+            results[end] = (self._report_route(start, end, vehicle_type, path_edges, total_cost), total_cost)
+        return results
+
+    def _report_route(self, start, end, vehicle_type, path_edges, total_cost):
+        """Prints a solved route with its governance trace and returns the hub names along it."""
+        if path_edges is None:
+            print(f"[!] No safe route found for {vehicle_type} from {start} to {end}.")
+            return None
+
+        path = [start] + [self.node_names[self.indices[e]] for e in path_edges]
+
+        print(f"\n[{vehicle_type}] Optimized Route: {' -> '.join(path)}")
+        print(f"Governance Cost Score: {total_cost:.2f}")
+
+        # Print Logic Trace for transparency
+        for i, e in enumerate(path_edges):
+            if self._status_code[e] != STATUS_CLEAR:
+                print(f"  > Segment {path[i]}-{path[i+1]}: {self._edge_status(e)}")
+
+        return path
 
 # --- DEMO EXECUTION SCENARIO ---
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+import contextlib
+import heapq
+import importlib.util
+import io
+import math
+import os
+import random
+import sys
+import unittest
+
+import engine
+
+MODES = ["E-Bus", "E-Rickshaw", "Ambulance"]
+ENGINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "engine.py")
+
+
+def load_pure_python_engine():
+    """Imports a second copy of engine.py with Numba hidden, so every kernel runs interpreted."""
+    saved = sys.modules.get("numba")
+    sys.modules["numba"] = None
+    try:
+        spec = importlib.util.spec_from_file_location("engine_pure_python", ENGINE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            del sys.modules["numba"]
+        else:
+            sys.modules["numba"] = saved
+    return module
+
+
+def random_city(seed, n_hubs=25, n_routes=70):
+    rnd = random.Random(seed)
+    hubs = [(f"Hub{i}" + ("_Ghat" if rnd.random() < 0.1 else ""), "Junction") for i in range(n_hubs)]
+    routes = []
+    for _ in range(n_routes):
+        u, v = rnd.sample(range(n_hubs), 2)
+        routes.append((hubs[u][0], hubs[v][0], rnd.randint(1, 50), rnd.choice(MODES)))
+    return hubs, routes
+
+
+def build_engine(module, hubs, routes):
+    class RandomCityEngine(module.KashiPathEngine):
+        def initialize_city_network(self):
+            self._build_csr(hubs, routes)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return RandomCityEngine()
+
+
+def reference_costs(eng, hubs, routes, feeds, vehicle_type):
+    """Governance weight of every route, recomputed from the raw feeds for `vehicle_type`."""
+    flood_lvl, aqi, road_conditions, crowd_densities = feeds
+    allowed = {vehicle_type, "E-Bus"} if vehicle_type == "Ambulance" else {vehicle_type}
+    costs = {}
+    for u, v, base_time, mode in routes:
+        cost = float(base_time)
+        if road_conditions.get(f"{u}-{v}", 80.0) > eng.IRI_BAD_THRESHOLD:
+            cost *= 1.4
+        density = crowd_densities.get(v, 0.5)
+        if density > eng.CROWD_SAFETY_LIMIT:
+            cost *= density / 2.0
+        if aqi > 200:
+            cost *= 1.1 if mode == "E-Rickshaw" else 1.05
+        if flood_lvl >= eng.FLOOD_DANGER_MARK and ("Ghat" in u or "Ghat" in v):
+            cost = eng.BLOCKADE_COST
+        if mode not in allowed:
+            cost = eng.BLOCKADE_COST
+        costs[(u, v)] = min(cost, costs.get((u, v), math.inf))
+    return costs
+
+
+def reference_dijkstra(hubs, costs, start):
+    adjacency = {name: [] for name, _ in hubs}
+    for (u, v), cost in costs.items():
+        adjacency[u].append((v, cost))
+    dist = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, cost in adjacency[u]:
+            if d + cost < dist.get(v, math.inf):
+                dist[v] = d + cost
+                heapq.heappush(heap, (d + cost, v))
+    return dist
+
+
+class RoutingMatchesReferenceTest(unittest.TestCase):
+    module = engine
+
+    def assertCost(self, actual, expected):
+        self.assertLessEqual(abs(actual - expected), 1e-3 + 1e-6 * expected)
+
+    def assertRoute(self, path, start, end, costs, expected):
+        if math.isinf(expected):
+            self.assertIsNone(path)
+            return
+        self.assertIsNotNone(path)
+        self.assertEqual((path[0], path[-1]), (start, end))
+        self.assertCost(sum(costs[(u, v)] for u, v in zip(path, path[1:])), expected)
+
+    def check_tick(self, eng, hubs, routes, feeds, rnd):
+        with contextlib.redirect_stdout(io.StringIO()):
+            eng.sync_governance_data(*feeds)
+        names = [name for name, _ in hubs]
+        for vehicle_type in MODES:
+            costs = reference_costs(eng, hubs, routes, feeds, vehicle_type)
+            for start in rnd.sample(names, 5):
+                dist = reference_dijkstra(hubs, costs, start)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for end in names:
+                        path = eng.solve_path(start, end, vehicle_type)
+                        self.assertRoute(path, start, end, costs, dist.get(end, math.inf))
+
+                    # Few destinations take the point-to-point path, many share one search
+                    for ends in (rnd.sample(names, 3), names):
+                        results = eng.solve_paths_one_to_many(start, ends, vehicle_type)
+                        for end in ends:
+                            path, total_cost = results[end]
+                            expected = dist.get(end, math.inf)
+                            self.assertRoute(path, start, end, costs, expected)
+                            if not math.isinf(expected):
+                                self.assertCost(total_cost, expected)
+
+    def run_city(self, seed, crowd_safety_limit=None):
+        hubs, routes = random_city(seed)
+        eng = build_engine(self.module, hubs, routes)
+        if crowd_safety_limit is not None:
+            eng.CROWD_SAFETY_LIMIT = crowd_safety_limit
+        rnd = random.Random(seed)
+        names = [name for name, _ in hubs]
+        for _ in range(3):
+            feeds = (rnd.choice([70.0, 72.0]), rnd.choice([150, 250]),
+                     {f"{u}-{v}": rnd.choice([100, 200]) for u, v, _, _ in rnd.sample(routes, 20)},
+                     {hub: rnd.choice([0.5, 1.05, 5.0, 8.0]) for hub in rnd.sample(names, 8)})
+            self.check_tick(eng, hubs, routes, feeds, rnd)
+
+    def test_random_cities(self):
+        for seed in range(8):
+            with self.subTest(seed=seed):
+                self.run_city(seed)
+
+    def test_tick_undercutting_base_times(self):
+        # A crowd limit below 2 lets the surge factor price edges under their base time
+        for seed in range(8):
+            with self.subTest(seed=seed):
+                self.run_city(seed, crowd_safety_limit=1.0)
+
+
+class PurePythonRoutingMatchesReferenceTest(RoutingMatchesReferenceTest):
+    module = load_pure_python_engine()
+
+    def test_numba_is_disabled(self):
+        self.assertFalse(self.module.NUMBA_AVAILABLE)
+
+
+class GovernanceTraceTest(unittest.TestCase):
+    def test_surge_label_keeps_reading_snapshot(self):
+        eng = build_engine(engine, [("A", "Transit"), ("B", "Transit")], [("A", "B", 10, "E-Bus")])
+        feed = {"B": 6}
+        with contextlib.redirect_stdout(io.StringIO()):
+            eng.sync_governance_data(10, 50, {}, feed)
+        feed.clear()
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            eng.solve_path("A", "B", "E-Bus")
+        self.assertIn("SURGE_ALERT_6P/m2", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()